@@ -31,7 +31,10 @@ class DataUpdate(Base):
         data: Any,
     ) -> None:
         """Update the data with the given name and value, and invoke the updated callback."""
-        setattr(self.data, name, data)
+        # Only replace the stored data when it changed. Listeners are always
+        # notified, those registered since the last update have not seen it.
+        if getattr(self.data, name) != data:
+            setattr(self.data, name, data)
         await self._updated_callback(name)
 
     def request_update_data(self) -> None:
@@ -39,9 +39,10 @@ class UpdateThread(BaseThread):
             # Update the next run before running the update
             self.update_next_run()
 
-            # Run the update
+            # Run the update, asyncio.run closes the loop and its default
+            # executor afterwards so their worker threads do not pile up
             try:
-                asyncio.new_event_loop().run_until_complete(self.update())
+                asyncio.run(self.update())
             except Exception as exception:  # pylint: disable=broad-except
                 self._logger.exception(exception)
 
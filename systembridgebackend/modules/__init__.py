@@ -88,6 +88,7 @@ class ModulesUpdate(Base):
         sensors_data = await sensors_update.update_all_data()
         await self._updated_callback("sensors", sensors_data)
 
+        started_tasks: list[Task] = []
         for module_class in self._classes:
             # If the class has a sensors attribute, set it
             if hasattr(module_class.cls, "sensors"):
@@ -106,6 +107,7 @@ class ModulesUpdate(Base):
                     self.update_module(module_class),
                     name=f"Module Update: {module_class.name}",
                 )
+                started_tasks.append(self.tasks[module_class.name])
             except Exception as exception:  # pylint: disable=broad-except
                 self._logger.exception(
                     "Failed to update module: %s",
@@ -117,3 +119,8 @@ class ModulesUpdate(Base):
             await asyncio.sleep(1)
 
         self._logger.info("Data update tasks started")
+
+        # Each update runs in its own event loop, which stops when this returns.
+        # Wait for the modules, or any still running in a thread never finish.
+        await asyncio.gather(*started_tasks)
+        self._logger.info("Data update tasks finished")
@@ -1,7 +1,10 @@
 """CPU."""
 
 import asyncio
-from typing import override
+from dataclasses import dataclass, field
+from functools import cache
+from operator import attrgetter
+from typing import Final, override
 
 from psutil import (
     cpu_count,
@@ -15,10 +18,128 @@ from psutil import (
 from psutil._common import pcputimes, scpufreq, scpustats, shwtemp
 
 from systembridgemodels.modules.cpu import CPU, CPUFrequency, CPUStats, CPUTimes, PerCPU
-from systembridgemodels.modules.sensors import Sensors
+from systembridgemodels.modules.sensors import (
+    Sensors,
+    SensorsWindowsHardware,
+    SensorsWindowsSensor,
+)
 
 from .base import ModuleUpdateBase
 
+_IS_POWER: Final[int] = 1
+_IS_TEMPERATURE: Final[int] = 2
+_IS_VOLTAGE: Final[int] = 4
+_IS_PACKAGE: Final[int] = 8
+_IS_CORE: Final[int] = 16
+_IS_AVERAGE: Final[int] = 32
+
+_POWER_CORE: Final[int] = _IS_POWER | _IS_CORE
+_POWER_PACKAGE: Final[int] = _IS_POWER | _IS_PACKAGE
+
+
+@cache
+def _get_sensor_flags(sensor_type: str, sensor_name: str) -> int:
+    """Classify a sensor by its type and name."""
+    sensor_type = sensor_type.upper()
+    sensor_name = sensor_name.upper()
+    flags = 0
+    if "POWER" in sensor_type:
+        flags |= _IS_POWER
+    if "TEMPERATURE" in sensor_type:
+        flags |= _IS_TEMPERATURE
+    if "VOLTAGE" in sensor_type:
+        flags |= _IS_VOLTAGE
+    if "PACKAGE" in sensor_name:
+        flags |= _IS_PACKAGE
+    if "CORE" in sensor_name:
+        flags |= _IS_CORE
+    if "AVERAGE" in sensor_name:
+        flags |= _IS_AVERAGE
+    return flags
+
+
+@cache
+def _get_sensor_index(sensor_id: str) -> int | None:
+    """Get the core index from a sensor id."""
+    # "/amdcpu/0/voltage/16" -> 16
+    try:
+        return int(sensor_id.rsplit("/", 1)[-1])
+    except ValueError:
+        return None
+
+
+@cache
+def _get_times_getter(times_fields: tuple[str, ...]) -> attrgetter:
+    """Get a getter for the CPUTimes fields of a psutil CPU times type."""
+    # CPUTimes fields in positional order. Platforms without "interrupt" and
+    # "dpc" (everything but Windows) leave them to the dataclass defaults.
+    return attrgetter(
+        *(
+            field
+            for field in ("user", "system", "idle", "interrupt", "dpc")
+            if field in times_fields
+        )
+    )
+
+
+def _get_times_fields(times: pcputimes) -> tuple[float, ...]:
+    """Get the CPUTimes values from psutil CPU times."""
+    return _get_times_getter(times._fields)(times)
+
+
+def _get_times_mean(times_per_cpu: list[pcputimes]) -> pcputimes:
+    """Average CPU times percentages across all CPUs."""
+    count = len(times_per_cpu)
+    return type(times_per_cpu[0])._make(
+        round(sum(values) / count, 1) for values in zip(*times_per_cpu)
+    )
+
+
+def _get_times_sum(times_per_cpu: list[pcputimes]) -> pcputimes:
+    """Sum CPU times across all CPUs."""
+    return type(times_per_cpu[0])._make(sum(values) for values in zip(*times_per_cpu))
+
+
+@dataclass
+class _WindowsSensorValues:
+    """CPU values found in the Windows sensors."""
+
+    power_package: float | None = None
+    power_per_cpu: list[float] | None = None
+    temperature: float | None = None
+    voltage_sensors: list[SensorsWindowsSensor] = field(default_factory=list)
+
+
+class CPUSampler:
+    """Sample CPU percentages over a shared interval."""
+
+    def __init__(self, interval: float = 1) -> None:
+        """Initialise."""
+        self.interval = interval
+        self.times_per_cpu_percent: list[pcputimes] = []
+        self.usage: float = 0.0
+        self.usage_per_cpu: list[float] = []
+
+    async def refresh(self) -> None:
+        """Sample all CPU percentages over one interval."""
+        # Prime the counters so the next readings measure from now
+        cpu_percent(interval=None, percpu=False)
+        cpu_percent(interval=None, percpu=True)
+        cpu_times_percent(interval=None, percpu=True)
+
+        # Wait without blocking the event loop
+        await asyncio.sleep(self.interval)
+
+        (
+            self.usage,
+            self.usage_per_cpu,
+            self.times_per_cpu_percent,
+        ) = await asyncio.gather(
+            asyncio.to_thread(cpu_percent, interval=None, percpu=False),
+            asyncio.to_thread(cpu_percent, interval=None, percpu=True),
+            asyncio.to_thread(cpu_times_percent, interval=None, percpu=True),
+        )
+
 
 class CPUUpdate(ModuleUpdateBase):
     """CPU Update."""
@@ -27,103 +148,134 @@ class CPUUpdate(ModuleUpdateBase):
         """Initialise."""
         super().__init__()
 
+        # The logical CPU count does not change while the process is running
         self._count: int = cpu_count()
+        self._sampler = CPUSampler()
+
+        self._cpu_hardware: list[SensorsWindowsHardware] | None = None
+        self._sensors: Sensors | None = None
+
+    @property
+    def sensors(self) -> Sensors | None:
+        """Sensors."""
+        return self._sensors
 
-        self.sensors: Sensors | None = None
+    @sensors.setter
+    def sensors(self, sensors: Sensors | None) -> None:
+        """Set sensors and cache the CPU hardware."""
+        self._sensors = sensors
+        self._cpu_hardware = (
+            [
+                hardware
+                for hardware in sensors.windows_sensors.hardware
+                # Find type "CPU"
+                if "CPU" in hardware.type.upper()
+            ]
+            if sensors is not None
+            and sensors.windows_sensors is not None
+            and sensors.windows_sensors.hardware is not None
+            else None
+        )
 
     async def _get_frequency(self) -> scpufreq:
         """CPU frequency."""
-        return cpu_freq()
+        return await asyncio.to_thread(cpu_freq)
 
     async def _get_frequency_per_cpu(
         self,
     ) -> list[scpufreq]:
         """CPU frequency per CPU."""
-        return cpu_freq(percpu=True)  # type: ignore
+        return await asyncio.to_thread(cpu_freq, percpu=True)  # type: ignore
 
     async def _get_load_average(self) -> float:
         """Get load average."""
         avg_tuple = getloadavg()
         return sum([avg_tuple[0], avg_tuple[1], avg_tuple[2]]) / 3
 
-    async def _get_power_package(self) -> float | None:
-        """CPU package power."""
-        if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
-        ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "CPU"
-            if "CPU" not in hardware.type.upper():
-                continue
+    def _scan_windows_sensors(self) -> _WindowsSensorValues:
+        """Find all CPU values in the Windows sensors in a single pass."""
+        values = _WindowsSensorValues()
+        if self._cpu_hardware is None:
+            return values
+        power_per_cpu: list[float] = [-1] * self._count
+        values.power_per_cpu = power_per_cpu
+        for hardware in self._cpu_hardware:
+            has_core_power = False
+            power_sensors: list[SensorsWindowsSensor] = []
             for sensor in hardware.sensors:
+                if sensor.value is None:
+                    continue
+                flags = _get_sensor_flags(sensor.type, sensor.name)
                 # Find type "POWER" and name "PACKAGE"
-                if (
-                    "POWER" in sensor.type.upper()
-                    and "PACKAGE" in sensor.name.upper()
-                    and sensor.value is not None
-                ):
+                if flags & _POWER_PACKAGE == _POWER_PACKAGE:
+                    if values.power_package is None and isinstance(
+                        sensor.value, (int, float)
+                    ):
+                        self._logger.debug(
+                            "Found CPU package power: %s = %s",
+                            sensor.name,
+                            sensor.value,
+                        )
+                        values.power_package = float(sensor.value)
+                # Find type "POWER" and not name "PACKAGE"
+                elif flags & _IS_POWER:
+                    power_sensors.append(sensor)
+                # Find type "POWER" and name "CORE"
+                if flags & _POWER_CORE == _POWER_CORE:
                     self._logger.debug(
-                        "Found CPU package power: %s = %s", sensor.name, sensor.value
-                    )
-                    return (
-                        float(sensor.value)
-                        if isinstance(sensor.value, (int, float))
-                        else None
+                        "Found CPU core power: %s (%s) = %s",
+                        sensor.name,
+                        sensor.id,
+                        sensor.value,
                     )
-        return None
-
-    async def _get_power_per_cpu(self) -> list[float] | None:
-        """CPU package power."""
-        powers: list[float] = [-1] * self._count
-        if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
-        ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "CPU"
-            if "CPU" not in hardware.type.upper():
-                continue
-            for sensor in hardware.sensors:
-                # Find type "POWER" and name "CORE"
+                    has_core_power = True
+                # Find type "TEMPERATURE" and name "PACKAGE" or "AVERAGE"
                 if (
-                    "POWER" in sensor.type.upper()
-                    and "CORE" in sensor.name.upper()
-                    and sensor.value is not None
+                    values.temperature is None
+                    and flags & _IS_TEMPERATURE
+                    and flags & (_IS_PACKAGE | _IS_AVERAGE)
+                    and isinstance(sensor.value, (int, float, str))
                 ):
                     self._logger.debug(
-                        "Found CPU core power: %s (%s) = %s",
+                        "Found CPU temperature: %s = %s",
+                        sensor.name,
+                        sensor.value,
+                    )
+                    values.temperature = float(sensor.value)
+                # Find type "VOLTAGE"
+                if flags & _IS_VOLTAGE:
+                    self._logger.debug(
+                        "Found CPU voltage: %s (%s) = %s",
                         sensor.name,
                         sensor.id,
                         sensor.value,
                     )
-                    for sensor in hardware.sensors:
-                        # Find type "POWER" and name "PACKAGE"
-                        if (
-                            "POWER" in sensor.type.upper()
-                            and "PACKAGE" not in sensor.name.upper()
-                            and sensor.value is not None
-                        ):
-                            self._logger.debug(
-                                "Found CPU package power: %s (%s) = %s",
-                                sensor.name,
-                                sensor.id,
-                                sensor.value,
-                            )
-                            index = int(sensor.id.split("/")[-1])
-                            powers[index] = float(sensor.value)
+                    values.voltage_sensors.append(sensor)
 
-        return powers
+            # Per CPU power is only reported when the hardware has core power
+            if not has_core_power:
+                continue
+            for sensor in power_sensors:
+                self._logger.debug(
+                    "Found CPU power: %s (%s) = %s",
+                    sensor.name,
+                    sensor.id,
+                    sensor.value,
+                )
+                index = _get_sensor_index(sensor.id)
+                if index is not None and 0 <= index < self._count:
+                    power_per_cpu[index] = float(sensor.value)
+
+        return values
 
     async def _get_stats(self) -> scpustats:
         """CPU stats."""
-        return cpu_stats()
+        return await asyncio.to_thread(cpu_stats)
 
-    async def _get_temperature(self) -> float | None:
+    async def _get_temperature(
+        self,
+        windows_temperature: float | None,
+    ) -> float | None:
         """CPU temperature."""
         if self.sensors is not None:
             if self.sensors.temperatures is not None:
@@ -166,89 +318,22 @@ class CPUUpdate(ModuleUpdateBase):
                             "Unknown sensor used (may not be correct): %s", sensor
                         )
                         return sensor.current
-            if (
-                self.sensors.windows_sensors is not None
-                and self.sensors.windows_sensors.hardware is not None
-            ):
-                for hardware in self.sensors.windows_sensors.hardware:
-                    # Find type "CPU"
-                    if "CPU" not in hardware.type.upper():
-                        continue
-                    for sensor in hardware.sensors:
-                        name = sensor.name.upper()
-                        # Find type "TEMPERATURE" and name "PACKAGE" or "AVERAGE"
-                        if (
-                            "TEMPERATURE" in sensor.type.upper()
-                            and ("PACKAGE" in name or "AVERAGE" in name)
-                            and sensor.value is not None
-                        ):
-                            self._logger.debug(
-                                "Found CPU temperature: %s = %s",
-                                sensor.name,
-                                sensor.value,
-                            )
-                            return (
-                                float(sensor.value)
-                                if isinstance(sensor.value, (int, float, str))
-                                else None
-                            )
+            return windows_temperature
         return None
 
-    async def _get_times(self) -> pcputimes:
-        """CPU times."""
-        return cpu_times(percpu=False)
-
-    async def _get_times_percent(self) -> pcputimes:
-        """CPU times percent."""
-        return cpu_times_percent(interval=1, percpu=False)
-
     async def _get_times_per_cpu(
         self,
     ) -> list[pcputimes]:
         """CPU times per CPU."""
-        return cpu_times(percpu=True)
+        return await asyncio.to_thread(cpu_times, percpu=True)
 
-    async def _get_times_per_cpu_percent(
+    async def _get_voltages(
         self,
-    ) -> list[pcputimes]:
-        """CPU times per CPU percent."""
-        return cpu_times_percent(interval=1, percpu=True)
-
-    async def _get_usage(self) -> float:
-        """CPU usage."""
-        return cpu_percent(interval=1, percpu=False)
-
-    async def _get_usage_per_cpu(
-        self,
-    ) -> list[float]:
-        """CPU usage per CPU."""
-        return cpu_percent(interval=1, percpu=True)  # type: ignore
-
-    async def _get_voltages(self) -> tuple[float | None, list[float]]:
+        voltage_sensors: list[SensorsWindowsSensor],
+    ) -> tuple[float | None, list[float]]:
         """CPU voltage."""
         voltage: float | None = None
         voltages: list[float] = [-1] * self._count
-        voltage_sensors = []
-        if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
-        ):
-            return (voltage, voltages)
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "CPU"
-            if "CPU" not in hardware.type.upper():
-                continue
-            for sensor in hardware.sensors:
-                # Find type "VOLTAGE"
-                if "VOLTAGE" in sensor.type.upper() and sensor.value is not None:
-                    self._logger.debug(
-                        "Found CPU voltage: %s (%s) = %s",
-                        sensor.name,
-                        sensor.id,
-                        sensor.value,
-                    )
-                    voltage_sensors.append(sensor)
 
         # Handle voltages
         if voltage_sensors is not None and len(voltage_sensors) > 0:
@@ -260,10 +345,8 @@ class CPUUpdate(ModuleUpdateBase):
                         sensor.type,
                         sensor.value,
                     )
-                    # "/amdcpu/0/voltage/16" -> 16
-                    # Get the last part of the id
-                    index = int(sensor.id.split("/")[-1])
-                    if 0 <= index < self._count:
+                    index = _get_sensor_index(sensor.id)
+                    if index is not None and 0 <= index < self._count:
                         voltages[index] = float(sensor.value)
             voltage_sum = 0
             for voltage in voltages:
@@ -282,58 +365,44 @@ class CPUUpdate(ModuleUpdateBase):
         """Update all data."""
         self._logger.debug("Update all data")
 
-        self._count = cpu_count()
+        windows_sensor_values = self._scan_windows_sensors()
 
+        # The other values are read while the sampler waits for its interval
         (
+            _,
             frequency,
             frequency_per_cpu,
             load_average,
-            power_package,
-            power_per_cpu,
             stats,
             temperature,
-            times,
-            times_percent,
             times_per_cpu,
-            times_per_cpu_percent,
-            usage,
-            usage_per_cpu,
             [voltage, voltages],
         ) = await asyncio.gather(
-            *[
-                self._get_frequency(),
-                self._get_frequency_per_cpu(),
-                self._get_load_average(),
-                self._get_power_package(),
-                self._get_power_per_cpu(),
-                self._get_stats(),
-                self._get_temperature(),
-                self._get_times(),
-                self._get_times_percent(),
-                self._get_times_per_cpu(),
-                self._get_times_per_cpu_percent(),
-                self._get_usage(),
-                self._get_usage_per_cpu(),
-                self._get_voltages(),
-            ]
+            self._sampler.refresh(),
+            self._get_frequency(),
+            self._get_frequency_per_cpu(),
+            self._get_load_average(),
+            self._get_stats(),
+            self._get_temperature(windows_sensor_values.temperature),
+            self._get_times_per_cpu(),
+            self._get_voltages(windows_sensor_values.voltage_sensors),
         )
 
+        times_per_cpu_percent = self._sampler.times_per_cpu_percent
+        usage_per_cpu = self._sampler.usage_per_cpu
+        power_per_cpu = windows_sensor_values.power_per_cpu
+        # Derive the totals from the per CPU values, rather than reading again
+        times = _get_times_sum(times_per_cpu)
+        times_percent = _get_times_mean(times_per_cpu_percent)
+
         return CPU(
             count=self._count,
-            frequency=CPUFrequency(
-                current=frequency.current,
-                min=frequency.min,
-                max=frequency.max,
-            ),
+            frequency=CPUFrequency(*frequency),
             load_average=load_average,
             per_cpu=[
                 PerCPU(
                     id=index,
-                    frequency=CPUFrequency(
-                        current=frequency_per_cpu[index].current,
-                        min=frequency_per_cpu[index].min,
-                        max=frequency_per_cpu[index].max,
-                    )
+                    frequency=CPUFrequency(*frequency_per_cpu[index])
                     if frequency_per_cpu is not None and index < len(frequency_per_cpu)
                     else None,
                     power=power_per_cpu[index]
@@ -341,29 +410,11 @@ class CPUUpdate(ModuleUpdateBase):
                     and index < len(power_per_cpu)
                     and power_per_cpu[index] > 0
                     else None,
-                    times=CPUTimes(
-                        user=times_per_cpu[index].user,
-                        system=times_per_cpu[index].system,
-                        idle=times_per_cpu[index].idle,
-                        interrupt=times_per_cpu[index].interrupt
-                        if hasattr(times_per_cpu[index], "interrupt")
-                        else None,
-                        dpc=times_per_cpu[index].dpc
-                        if hasattr(times_per_cpu[index], "dpc")
-                        else None,
-                    )
+                    times=CPUTimes(*_get_times_fields(times_per_cpu[index]))
                     if times_per_cpu is not None and index < len(times_per_cpu)
                     else None,
                     times_percent=CPUTimes(
-                        user=times_per_cpu_percent[index].user,
-                        system=times_per_cpu_percent[index].system,
-                        idle=times_per_cpu_percent[index].idle,
-                        interrupt=times_per_cpu_percent[index].interrupt
-                        if hasattr(times_per_cpu_percent[index], "interrupt")
-                        else None,
-                        dpc=times_per_cpu_percent[index].dpc
-                        if hasattr(times_per_cpu_percent[index], "dpc")
-                        else None,
+                        *_get_times_fields(times_per_cpu_percent[index])
                     )
                     if times_per_cpu_percent is not None
                     and index < len(times_per_cpu_percent)
@@ -379,30 +430,11 @@ class CPUUpdate(ModuleUpdateBase):
                 )
                 for index in range(self._count)
             ],
-            power=power_package,
-            stats=CPUStats(
-                ctx_switches=stats.ctx_switches,
-                interrupts=stats.interrupts,
-                soft_interrupts=stats.soft_interrupts,
-                syscalls=stats.syscalls,
-            ),
+            power=windows_sensor_values.power_package,
+            stats=CPUStats(*stats),
             temperature=temperature,
-            times=CPUTimes(
-                user=times.user,
-                system=times.system,
-                idle=times.idle,
-                interrupt=times.interrupt if hasattr(times, "interrupt") else None,
-                dpc=times.dpc if hasattr(times, "dpc") else None,
-            ),
-            times_percent=CPUTimes(
-                user=times_percent.user,
-                system=times_percent.system,
-                idle=times_percent.idle,
-                interrupt=times_percent.interrupt
-                if hasattr(times_percent, "interrupt")
-                else None,
-                dpc=times_percent.dpc if hasattr(times_percent, "dpc") else None,
-            ),
-            usage=usage,
+            times=CPUTimes(*_get_times_fields(times)),
+            times_percent=CPUTimes(*_get_times_fields(times_percent)),
+            usage=self._sampler.usage,
             voltage=voltage,
         )
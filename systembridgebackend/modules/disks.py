@@ -1,7 +1,8 @@
 """Disks."""
 
 import asyncio
-from typing import override
+import sys
+from typing import Final, override
 
 from psutil import disk_io_counters, disk_partitions, disk_usage
 from psutil._common import sdiskio, sdiskpart, sdiskusage
@@ -16,27 +17,81 @@ from systembridgemodels.modules.disks import (
 
 from .base import ModuleUpdateBase
 
+# Pseudo filesystems with no storage behind them, and snap squashfs loops.
+# Reading their usage is wasted work. Anything else is reported, so network,
+# FUSE and less common filesystems still show up. overlay is kept as it is the
+# root filesystem inside Docker and Podman containers.
+PSEUDO_FILESYSTEM_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "proc",
+        "pstore",
+        "ramfs",
+        "rpc_pipefs",
+        "securityfs",
+        "selinuxfs",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    }
+)
+
 
 class DisksUpdate(ModuleUpdateBase):
     """Disks Update."""
 
-    async def _get_io_counters(self) -> sdiskio | None:
+    async def _get_io_counters(
+        self,
+        io_counters_per_disk: dict[str, sdiskio],
+    ) -> sdiskio | None:
         """Disk IO counters."""
-        return disk_io_counters()
+        # Linux totals only count whole disks, the per disk values include
+        # partitions, so they can not be summed
+        if sys.platform == "linux":
+            return await asyncio.to_thread(disk_io_counters)
+        if not io_counters_per_disk:
+            return None
+        io_counters = list(io_counters_per_disk.values())
+        return type(io_counters[0])._make(sum(values) for values in zip(*io_counters))
 
     async def _get_io_counters_per_disk(self) -> dict[str, sdiskio]:
         """Disk IO counters per disk."""
-        return disk_io_counters(perdisk=True)
+        return await asyncio.to_thread(disk_io_counters, perdisk=True)
 
     async def _get_partitions(self) -> list[sdiskpart]:
         """Disk partitions."""
-        return disk_partitions(all=True)
+        partitions = await asyncio.to_thread(disk_partitions, all=True)
+        return [
+            partition
+            for partition in partitions
+            if partition.fstype not in PSEUDO_FILESYSTEM_TYPES
+        ]
 
-    async def _get_usage(self, path: str) -> sdiskusage | None:
+    async def _get_usage(self, partition: sdiskpart) -> sdiskusage | None:
         """Disk usage."""
+        # Skip optical drives on Windows, reading usage can spin them up
+        if sys.platform == "win32" and "cdrom" in partition.opts.split(","):
+            return None
+        path = partition.mountpoint
         try:
-            return disk_usage(path)
-        except (FileNotFoundError, PermissionError) as error:
+            # Run in a thread, a slow or offline mount should not hold up others
+            return await asyncio.to_thread(disk_usage, path)
+        except OSError as error:
             self._logger.warning(
                 "Error getting disk usage for: %s",
                 path,
@@ -49,22 +104,26 @@ class DisksUpdate(ModuleUpdateBase):
         """Update all data."""
         self._logger.debug("Update all data")
 
-        io_counters, io_counters_per_disk, partitions = await asyncio.gather(
-            self._get_io_counters(),
+        io_counters_per_disk, partitions = await asyncio.gather(
             self._get_io_counters_per_disk(),
             self._get_partitions(),
         )
+        io_counters = await self._get_io_counters(io_counters_per_disk)
 
-        devices: list[Disk] = []
-        for partition in partitions:
-            usage = await self._get_usage(partition.mountpoint)
+        usages = await asyncio.gather(
+            *[self._get_usage(partition) for partition in partitions]
+        )
+
+        devices: dict[str, Disk] = {}
+        for partition, usage in zip(partitions, usages, strict=True):
             disk_partition = DiskPartition(
                 device=partition.device,
                 mount_point=partition.mountpoint,
                 filesystem_type=partition.fstype,
                 options=partition.opts,
-                max_file_size=partition.maxfile,
-                max_path_length=partition.maxpath,
+                # Removed from psutil in 6.0.0
+                max_file_size=getattr(partition, "maxfile", None),
+                max_path_length=getattr(partition, "maxpath", None),
                 usage=DiskUsage(
                     free=usage.free,
                     total=usage.total,
@@ -75,32 +134,28 @@ class DisksUpdate(ModuleUpdateBase):
                 else None,
             )
 
-            if partition.device not in devices:
-                io_counters_item = io_counters_per_disk.get(partition.device)
-                devices.append(
-                    Disk(
-                        name=partition.device,
-                        partitions=[disk_partition],
-                        io_counters=DiskIOCounters(
-                            read_count=io_counters_item.read_count,
-                            write_count=io_counters_item.write_count,
-                            read_bytes=io_counters_item.read_bytes,
-                            write_bytes=io_counters_item.write_bytes,
-                            read_time=io_counters_item.read_time,
-                            write_time=io_counters_item.write_time,
-                        )
-                        if io_counters_item
-                        else None,
-                    )
+            if (device := devices.get(partition.device)) is not None:
+                device.partitions.append(disk_partition)
+                continue
+
+            io_counters_item = io_counters_per_disk.get(partition.device)
+            devices[partition.device] = Disk(
+                name=partition.device,
+                partitions=[disk_partition],
+                io_counters=DiskIOCounters(
+                    read_count=io_counters_item.read_count,
+                    write_count=io_counters_item.write_count,
+                    read_bytes=io_counters_item.read_bytes,
+                    write_bytes=io_counters_item.write_bytes,
+                    read_time=io_counters_item.read_time,
+                    write_time=io_counters_item.write_time,
                 )
-            else:
-                for device in devices:
-                    if device.name == partition.device:
-                        device.partitions.append(disk_partition)
-                        break
+                if io_counters_item
+                else None,
+            )
 
         return Disks(
-            devices=devices,
+            devices=list(devices.values()),
             io_counters=DiskIOCounters(
                 read_count=io_counters.read_count,
                 write_count=io_counters.write_count,
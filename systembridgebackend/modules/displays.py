@@ -1,14 +1,36 @@
 """Displays."""
 
-from typing import override
+import asyncio
+from functools import cache
+from time import monotonic
+from typing import Final, override
 
-from screeninfo import ScreenInfoError, get_monitors
+from screeninfo import Monitor, ScreenInfoError, get_monitors
 
 from systembridgemodels.modules.displays import Display
-from systembridgemodels.modules.sensors import Sensors
+from systembridgemodels.modules.sensors import Sensors, SensorsWindowsHardware
 
 from .base import ModuleUpdateBase
 
+# Seconds between monitor layout refreshes, it rarely changes between updates
+MONITORS_CACHE_TIME: Final[int] = 60
+
+# Display fields and the parts their sensor names contain
+_SENSOR_FIELDS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ("pixel_clock", ("PIXEL", "CLOCK")),
+    ("refresh_rate", ("REFRESH", "RATE")),
+)
+
+
+@cache
+def _get_sensor_field(sensor_name: str) -> str | None:
+    """Get the display field for a sensor name."""
+    sensor_name = sensor_name.upper()
+    for field, name_parts in _SENSOR_FIELDS:
+        if all(part in sensor_name for part in name_parts):
+            return field
+    return None
+
 
 class DisplaysUpdate(ModuleUpdateBase):
     """Displays Update."""
@@ -18,137 +40,88 @@ class DisplaysUpdate(ModuleUpdateBase):
         super().__init__()
         self.sensors: Sensors | None = None
 
-    def _get_pixel_clock(
-        self,
-        display_key: str,
-    ) -> float | None:
-        """Display pixel clock."""
+        self._monitors: list[Monitor] | None = None
+        self._monitors_time: float = 0.0
+
+    async def _get_monitors(self) -> list[Monitor]:
+        """Get monitors, refreshed every MONITORS_CACHE_TIME."""
         if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
+            self._monitors is None
+            or monotonic() - self._monitors_time > MONITORS_CACHE_TIME
         ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "DISPLAY" and name display_key
-            if (
-                "DISPLAY" not in hardware.type.upper()
-                and display_key not in hardware.name.upper()
-            ):
-                continue
-            for sensor in hardware.sensors:
-                name = sensor.name.upper()
-                # Find name "PIXEL" and "CLOCK"
-                if "PIXEL" not in name or "CLOCK" not in name:
-                    continue
-                self._logger.debug(
-                    "Found display pixel clock: %s = %s",
-                    sensor.name,
-                    sensor.value,
-                )
-                return int(sensor.value) if sensor.value is not None else None
-        return None
+            self._monitors = await asyncio.to_thread(get_monitors)
+            self._monitors_time = monotonic()
+        return self._monitors
 
-    def sensors_refresh_rate(
-        self,
-        display_key: str,
-    ) -> float | None:
-        """Display refresh rate."""
+    def _get_hardware(self) -> list[SensorsWindowsHardware]:
+        """Windows sensors hardware."""
         if (
             self.sensors is None
             or self.sensors.windows_sensors is None
             or self.sensors.windows_sensors.hardware is None
         ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "DISPLAY" and name display_key
-            if (
-                "DISPLAY" not in hardware.type.upper()
-                and display_key not in hardware.name.upper()
-            ):
-                continue
-            for sensor in hardware.sensors:
-                name = sensor.name.upper()
-                # Find name "REFRESH" and "RATE"
-                if "REFRESH" not in name or "RATE" not in name:
-                    continue
-                self._logger.debug(
-                    "Found display refresh rate: %s = %s",
-                    sensor.name,
-                    sensor.value,
-                )
-                return int(sensor.value) if sensor.value is not None else None
-        return None
+            return []
+        return self.sensors.windows_sensors.hardware
 
-    def sensors_resolution_horizontal(
+    def _index_sensors(
         self,
-        display_key: str,
-    ) -> int | None:
-        """Display resolution horizontal."""
-        if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
-        ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "DISPLAY" and name display_key
-            if (
-                "DISPLAY" not in hardware.type.upper()
-                and display_key not in hardware.name.upper()
-            ):
+        hardware_list: list[SensorsWindowsHardware],
+    ) -> list[tuple[str, dict[str, int | None]]]:
+        """Index display sensor values by hardware name, in hardware order."""
+        index: list[tuple[str, dict[str, int | None]]] = []
+        for hardware in hardware_list:
+            # Find type "DISPLAY"
+            if "DISPLAY" not in hardware.type.upper():
                 continue
+            values: dict[str, int | None] = {}
+            index.append((hardware.name.upper(), values))
             for sensor in hardware.sensors:
-                name = sensor.name.upper()
-                # Find name "RESOLUTION" and "HORIZONTAL"
-                if "RESOLUTION" not in name or "HORIZONTAL" not in name:
+                field = _get_sensor_field(sensor.name)
+                if field is None or field in values:
                     continue
                 self._logger.debug(
-                    "Found display resolution horizontal: %s = %s",
+                    "Found display %s: %s = %s",
+                    field,
                     sensor.name,
                     sensor.value,
                 )
-                return int(sensor.value) if sensor.value is not None else None
-        return None
+                values[field] = int(sensor.value) if sensor.value is not None else None
+        return index
 
-    def sensors_resolution_vertical(
+    def _get_sensor_values(
         self,
+        index: list[tuple[str, dict[str, int | None]]],
         display_key: str,
-    ) -> int | None:
-        """Display resolution vertical."""
-        if (
-            self.sensors is None
-            or self.sensors.windows_sensors is None
-            or self.sensors.windows_sensors.hardware is None
-        ):
-            return None
-        for hardware in self.sensors.windows_sensors.hardware:
-            # Find type "DISPLAY" and name display_key
-            if (
-                "DISPLAY" not in hardware.type.upper()
-                and display_key not in hardware.name.upper()
-            ):
+    ) -> dict[str, int | None]:
+        """Display sensor values."""
+        # Take each field from the first display hardware with display_key in
+        # its name that has it, as more than one name can contain the key
+        values: dict[str, int | None] = {}
+        for name, hardware_values in index:
+            if display_key not in name:
                 continue
-            for sensor in hardware.sensors:
-                name = sensor.name.upper()
-                # Find name "RESOLUTION" and "VERTICAL"
-                if "RESOLUTION" not in name or "VERTICAL" not in name:
-                    continue
-                self._logger.debug(
-                    "Found display resolution vertical: %s = %s",
-                    sensor.name,
-                    sensor.value,
-                )
-                return int(sensor.value) if sensor.value is not None else None
-        return None
+            for field, value in hardware_values.items():
+                values.setdefault(field, value)
+        return values
 
     @override
     async def update_all_data(self) -> list[Display]:
         """Update all data."""
         self._logger.debug("Update all data")
 
+        # Walk the sensors once for all displays
+        index = self._index_sensors(self._get_hardware())
+
         try:
-            return [
+            monitors = await self._get_monitors()
+        except ScreenInfoError as error:
+            self._logger.error(error)
+            return []
+
+        displays: list[Display] = []
+        for key, monitor in enumerate(monitors):
+            sensor_values = self._get_sensor_values(index, str(key))
+            displays.append(
                 Display(
                     id=str(key),
                     name=monitor.name if monitor.name is not None else str(key),
@@ -159,11 +132,8 @@ class DisplaysUpdate(ModuleUpdateBase):
                     width=monitor.width_mm,
                     height=monitor.height_mm,
                     is_primary=monitor.is_primary,
-                    pixel_clock=self._get_pixel_clock(str(key)),
-                    refresh_rate=self.sensors_refresh_rate(str(key)),
+                    pixel_clock=sensor_values.get("pixel_clock"),
+                    refresh_rate=sensor_values.get("refresh_rate"),
                 )
-                for key, monitor in enumerate(get_monitors())
-            ]
-        except ScreenInfoError as error:
-            self._logger.error(error)
-            return []
+            )
+        return displays
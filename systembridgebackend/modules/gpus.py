@@ -1,12 +1,44 @@
 """GPUs."""
 
-from typing import override
+from functools import cache
+from typing import Final, override
 
 from systembridgemodels.modules.gpus import GPU
 from systembridgemodels.modules.sensors import Sensors
 
 from .base import ModuleUpdateBase
 
+# GPU fields with the parts their sensor type and name contain, checked in
+# order so the first match wins
+_SENSOR_FIELDS: Final[tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...]] = (
+    ("core_clock", ("CLOCK",), ("CORE",)),
+    ("core_load", ("LOAD",), ("CORE",)),
+    ("fan_speed", ("FAN",), ()),
+    ("memory_clock", ("CLOCK",), ("MEMORY",)),
+    ("memory_load", ("LOAD",), ("MEMORY",)),
+    ("memory_free", (), ("FREE", "MEMORY")),
+    ("memory_used", (), ("USED", "MEMORY")),
+    ("memory_total", (), ("TOTAL", "MEMORY")),
+    ("power_usage", (), ("POWER",)),
+    ("temperature", ("TEMPERATURE",), ("CORE",)),
+)
+
+
+@cache
+def _get_sensor_field(
+    sensor_type: str,
+    sensor_name: str,
+) -> str | None:
+    """Get the GPU field for a sensor type and name."""
+    sensor_type = sensor_type.upper()
+    sensor_name = sensor_name.upper()
+    for field, type_parts, name_parts in _SENSOR_FIELDS:
+        if all(part in sensor_type for part in type_parts) and all(
+            part in sensor_name for part in name_parts
+        ):
+            return field
+    return None
+
 
 class GPUsUpdate(ModuleUpdateBase):
     """GPUs Update."""
@@ -37,109 +69,32 @@ class GPUsUpdate(ModuleUpdateBase):
 
             self._logger.debug("Found GPU: %s (%s)", hardware.name, hardware.type)
 
-            gpu = GPU(
-                id=hardware.id,
-                name=hardware.name,
-            )
-
+            values: dict[str, float | None] = {}
             for sensor in hardware.sensors:
-                sensor_name = sensor.name.upper()
-                sensor_type = sensor.type.upper()
-                # Find "CLOCK" in type and "CORE" in name
-                if "CLOCK" in sensor_type and "CORE" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU core clock: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.core_clock = float(sensor.value) if sensor.value else None
-                # Find "LOAD" in type and "CORE" in name
-                elif "LOAD" in sensor_type and "CORE" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU core load: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.core_load = float(sensor.value) if sensor.value else None
-                # Find "FAN" in type
-                elif "FAN" in sensor_type:
-                    self._logger.debug(
-                        "Found GPU fan speed: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
+                if (field := _get_sensor_field(sensor.type, sensor.name)) is None:
+                    continue
+                self._logger.debug(
+                    "Found GPU %s: %s (%s) = %s",
+                    field,
+                    sensor.name,
+                    sensor.type,
+                    sensor.value,
+                )
+                if field == "fan_speed":
                     # Only use the first fan speed or if the fan speed is None
-                    if sensor.id.endswith("1") or gpu.fan_speed is None:
-                        gpu.fan_speed = (
+                    if sensor.id.endswith("1") or values.get(field) is None:
+                        values[field] = (
                             float(sensor.value) if sensor.value is not None else None
                         )
-                # Find "CLOCK" in type and "MEMORY" in name
-                elif "CLOCK" in sensor_type and "MEMORY" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU memory clock: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.memory_clock = float(sensor.value) if sensor.value else None
-                # Find "LOAD" in type and "MEMORY" in name
-                elif "LOAD" in sensor_type and "MEMORY" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU memory load: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.memory_load = float(sensor.value) if sensor.value else None
-                # Find "FREE" and "MEMORY" in name
-                elif "FREE" in sensor_name and "MEMORY" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU memory free: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.memory_free = float(sensor.value) if sensor.value else None
-                # Find "USED" and "MEMORY" in name
-                elif "USED" in sensor_name and "MEMORY" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU memory used: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.memory_used = float(sensor.value) if sensor.value else None
-                # Find "TOTAL" and "MEMORY" in name
-                elif "TOTAL" in sensor_name and "MEMORY" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU memory total: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.memory_total = float(sensor.value) if sensor.value else None
-                # Find "POWER" in name
-                elif "POWER" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU power: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.power_usage = float(sensor.value) if sensor.value else None
-                # Find "TEMPERATURE" and "CORE" in name
-                elif "TEMPERATURE" in sensor_type and "CORE" in sensor_name:
-                    self._logger.debug(
-                        "Found GPU temperature: %s (%s) = %s",
-                        sensor_name,
-                        sensor_type,
-                        sensor.value,
-                    )
-                    gpu.temperature = float(sensor.value) if sensor.value else None
-
-            gpus.append(gpu)
+                else:
+                    values[field] = float(sensor.value) if sensor.value else None
+
+            gpus.append(
+                GPU(
+                    id=hardware.id,
+                    name=hardware.name,
+                    **values,
+                )
+            )
 
         return gpus
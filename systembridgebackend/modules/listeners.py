@@ -1,5 +1,7 @@
 """Modules Listeners."""
 
+import asyncio
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
 
 from systembridgemodels.modules import ModulesData
@@ -12,6 +14,8 @@ from . import MODULES
 class Listener:
     """Listener."""
 
+    __slots__ = ("id", "send_response", "data_changed_callback", "modules")
+
     def __init__(
         self,
         listener_id: str,
@@ -32,7 +36,8 @@ class Listeners(Base):
     def __init__(self) -> None:
         """Initialise."""
         super().__init__()
-        self.registered_listeners: list[Listener] = []
+        self.registered_listeners: dict[str, Listener] = {}
+        self._listener_ids_by_module: defaultdict[str, set[str]] = defaultdict(set)
 
     async def add_listener(
         self,
@@ -42,14 +47,15 @@ class Listeners(Base):
         modules: list[str],
     ) -> bool:
         """Add modules to listener."""
-        for listner in self.registered_listeners:
-            if listner.id == listener_id:
-                self._logger.warning("Listener already registered: %s", listener_id)
-                return True
+        if listener_id in self.registered_listeners:
+            self._logger.warning("Listener already registered: %s", listener_id)
+            return True
 
-        self.registered_listeners.append(
-            Listener(listener_id, send_response, data_changed_callback, modules)
+        self.registered_listeners[listener_id] = Listener(
+            listener_id, send_response, data_changed_callback, modules
         )
+        for module in modules:
+            self._listener_ids_by_module[module].add(listener_id)
         self._logger.info("Added listener: %s", listener_id)
 
         return False
@@ -65,28 +71,41 @@ class Listeners(Base):
             self._logger.warning("Module to refresh not implemented: %s", module)
             return
 
-        for listener in self.registered_listeners:
-            self._logger.info("Listener: %s - %s", listener.id, listener.modules)
-            if module in listener.modules:
-                self._logger.info(
-                    "Sending '%s' data to listener: %s", module, listener.id
+        listeners = [
+            self.registered_listeners[listener_id]
+            for listener_id in self._listener_ids_by_module.get(module, ())
+        ]
+        self._logger.debug("Sending '%s' data to %s listeners", module, len(listeners))
+
+        # Send to all listeners at once, a slow listener should not hold up others
+        results = await asyncio.gather(
+            *[listener.data_changed_callback(module, data) for listener in listeners],
+            return_exceptions=True,
+        )
+        for listener, result in zip(listeners, results, strict=True):
+            if isinstance(result, Exception):
+                self._logger.error(
+                    "Failed to send '%s' data to listener: %s",
+                    module,
+                    listener.id,
+                    exc_info=result,
                 )
-                await listener.data_changed_callback(module, data)
 
     def remove_all_listeners(self) -> None:
         """Remove all listeners."""
         self.registered_listeners.clear()
+        self._listener_ids_by_module.clear()
 
     def remove_listener(
         self,
         listener_id: str,
     ) -> bool:
         """Remove listener."""
-        for listener in self.registered_listeners:
-            if listener.id == listener_id:
-                self.registered_listeners.remove(listener)
-                self._logger.info("Removed listener: %s", listener_id)
-                return True
-
-        self._logger.info("Listener not found: %s", listener_id)
-        return False
+        if (listener := self.registered_listeners.pop(listener_id, None)) is None:
+            self._logger.info("Listener not found: %s", listener_id)
+            return False
+
+        for module in listener.modules:
+            self._listener_ids_by_module[module].discard(listener_id)
+        self._logger.info("Removed listener: %s", listener_id)
+        return True
@@ -1,10 +1,8 @@
 """Memory."""
 
-import asyncio
-from typing import NamedTuple, override
+from typing import override
 
 from psutil import swap_memory, virtual_memory
-from psutil._common import sswap
 
 from systembridgemodels.modules.memory import Memory, MemorySwap, MemoryVirtual
 
@@ -14,25 +12,16 @@ from .base import ModuleUpdateBase
 class MemoryUpdate(ModuleUpdateBase):
     """Memory Update."""
 
-    async def _get_swap(self) -> sswap:
-        """Swap memory."""
-        return swap_memory()
-
-    async def _get_virtual(self) -> NamedTuple:
-        """Virtual memory."""
-        return virtual_memory()
-
     @override
     async def update_all_data(self) -> Memory:
         """Update all data."""
         self._logger.debug("Update all data")
 
-        swap, virtual = await asyncio.gather(
-            *[
-                self._get_swap(),
-                self._get_virtual(),
-            ]
-        )
+        # Both are quick reads, running them as tasks gains nothing
+        swap = swap_memory()
+        virtual = virtual_memory()
+
+        virtual_values = virtual._asdict()
 
         return Memory(
             swap=MemorySwap(
@@ -49,11 +38,12 @@ class MemoryUpdate(ModuleUpdateBase):
                 percent=virtual.percent,
                 used=virtual.used,
                 free=virtual.free,
-                active=getattr(virtual, "active", None),
-                inactive=getattr(virtual, "inactive", None),
-                buffers=getattr(virtual, "buffers", None),
-                cached=getattr(virtual, "cached", None),
-                wired=getattr(virtual, "wired", None),
-                shared=getattr(virtual, "shared", None),
+                # Fields that are only present on some platforms
+                active=virtual_values.get("active"),
+                inactive=virtual_values.get("inactive"),
+                buffers=virtual_values.get("buffers"),
+                cached=virtual_values.get("cached"),
+                wired=virtual_values.get("wired"),
+                shared=virtual_values.get("shared"),
             ),
         )
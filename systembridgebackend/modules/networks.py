@@ -4,7 +4,6 @@ import asyncio
 from typing import override
 
 from psutil import net_connections, net_if_addrs, net_if_stats, net_io_counters
-from psutil._common import sconn, snetio, snicaddr, snicstats
 
 from systembridgemodels.modules.networks import (
     Network,
@@ -21,42 +20,26 @@ from .base import ModuleUpdateBase
 class NetworksUpdate(ModuleUpdateBase):
     """Networks Update."""
 
-    async def _get_addresses(
-        self,
-    ) -> dict[str, list[snicaddr]]:
-        """Addresses."""
-        return net_if_addrs()
-
-    async def _get_connections(self) -> list[sconn]:
-        """Get connections."""
-        return net_connections("all")
-
-    async def _get_io_counters(self) -> snetio:
-        """IO Counters."""
-        return net_io_counters()
-
-    async def _get_stats(self) -> dict[str, snicstats]:
-        """Stats."""
-        return net_if_stats()
-
     @override
     async def update_all_data(self) -> Networks:
         """Update all data."""
         self._logger.debug("Update all data")
 
-        (addresses, connections, io_counters, stats) = await asyncio.gather(
-            *[
-                self._get_addresses(),
-                self._get_connections(),
-                self._get_io_counters(),
-                self._get_stats(),
-            ]
+        # Walking the connection tables can be slow. run_in_executor starts the
+        # thread straight away, so the quick reads below overlap with it
+        connections_future = asyncio.get_running_loop().run_in_executor(
+            None, net_connections, "all"
         )
+        addresses = net_if_addrs()
+        io_counters = net_io_counters()
+        stats = net_if_stats()
+        connections = await connections_future
 
         networks: list[Network] = []
 
         for name, stat in stats.items():
-            addrs = addresses.get(name, None)
+            # An interface can be in the stats but have no addresses
+            addrs = addresses.get(name, [])
             networks.append(
                 Network(
                     name=name,
@@ -70,16 +53,12 @@ class NetworksUpdate(ModuleUpdateBase):
                         )
                         for address in addrs
                     ],
-                    stats=NetworkStats(
-                        isup=stat.isup,
-                        duplex=stat.duplex,
-                        speed=stat.speed,
-                        mtu=stat.mtu,
-                        flags=stat.flags,
-                    ),
+                    stats=NetworkStats(*stat),
                 )
             )
 
+        # The psutil stats and IO tuples share the field order of their models,
+        # so they are passed positionally. Connections leave out the pid.
         return Networks(
             connections=[
                 NetworkConnection(
@@ -92,15 +71,6 @@ class NetworksUpdate(ModuleUpdateBase):
                 )
                 for connection in connections
             ],
-            io=NetworkIO(
-                bytes_recv=io_counters.bytes_recv,
-                bytes_sent=io_counters.bytes_sent,
-                dropin=io_counters.dropin,
-                dropout=io_counters.dropout,
-                errin=io_counters.errin,
-                errout=io_counters.errout,
-                packets_recv=io_counters.packets_recv,
-                packets_sent=io_counters.packets_sent,
-            ),
+            io=NetworkIO(*io_counters),
             networks=networks,
         )
@@ -1,41 +1,79 @@
 """Processes."""
 
-from typing import override
+import asyncio
+from typing import Any, Final, override
 
-from psutil import AccessDenied, NoSuchProcess, process_iter
+from psutil import NoSuchProcess, process_iter
 
 from systembridgemodels.modules.processes import Process
 
 from .base import ModuleUpdateBase
 
+# Attributes that change while a process runs, read on every update
+_PROCESS_ATTRIBUTES: Final[list[str]] = [
+    "cpu_percent",
+    "create_time",
+    "memory_percent",
+    "name",
+    "status",
+]
+
+# Attributes that are slow to resolve and rarely change, read once per process
+_PROCESS_STATIC_ATTRIBUTES: Final[list[str]] = [
+    "exe",
+    "username",
+]
+
 
 class ProcessesUpdate(ModuleUpdateBase):
     """Processes Update."""
 
+    def __init__(self) -> None:
+        """Initialise."""
+        super().__init__()
+        # Keyed by pid and create time, so a reused pid is read again
+        self._static_info: dict[tuple[int, float | None], dict[str, Any]] = {}
+
+    def _get_processes(self) -> list[Process]:
+        """Get processes."""
+        items: list[Process] = []
+        static_info: dict[tuple[int, float | None], dict[str, Any]] = {}
+        # Let psutil read the attributes in one pass per process. Attributes
+        # that can not be read are set to None and vanished processes skipped
+        for process in process_iter(_PROCESS_ATTRIBUTES, ad_value=None):
+            info = process.info
+            key = (process.pid, info["create_time"])
+            if (static := self._static_info.get(key)) is None:
+                try:
+                    static = process.as_dict(_PROCESS_STATIC_ATTRIBUTES, ad_value=None)
+                except NoSuchProcess:
+                    continue
+            static_info[key] = static
+
+            items.append(
+                Process(
+                    id=process.pid,
+                    name=info["name"],
+                    cpu_usage=info["cpu_percent"],
+                    created=info["create_time"],
+                    memory_usage=info["memory_percent"],
+                    path=static["exe"],
+                    status=info["status"],
+                    username=static["username"],
+                )
+            )
+        # Only keep processes that are still running
+        self._static_info = static_info
+
+        # Sort by name, in place rather than into a second list
+        items.sort(key=lambda item: item.name or "")
+
+        return items
+
     @override
     async def update_all_data(self) -> list[Process]:
         """Update all data."""
         self._logger.debug("Update all data")
 
-        process_list = list(process_iter())
-
-        # Get names of processes
-        items = []
-        for process in process_list:
-            model = Process(id=process.pid)
-
-            try:
-                model.name = process.name()
-                model.cpu_usage = process.cpu_percent()
-                model.created = process.create_time()
-                model.memory_usage = process.memory_percent()
-                model.path = process.exe()
-                model.status = process.status()
-                model.username = process.username()
-            except (AccessDenied, NoSuchProcess, OSError):
-                pass
-            items.append(model)
-        # Sort by name
-        items = sorted(items, key=lambda item: item.name or "")
-
-        return items
+        # Reading every process is a long run of blocking /proc reads
+        return await asyncio.to_thread(self._get_processes)
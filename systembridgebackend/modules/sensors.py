@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import subprocess
 import sys
 
 import psutil
@@ -22,21 +21,123 @@ from systembridgemodels.modules.sensors import (
 
 from .base import ModuleUpdateBase
 
+# Not every platform provides these, look them up once
+_sensors_fans = getattr(psutil, "sensors_fans", None)
+_sensors_temperatures = getattr(psutil, "sensors_temperatures", None)
+
+
+def _get_hardware(hardware: dict) -> SensorsWindowsHardware:
+    """Get Windows sensors hardware and its subhardware."""
+    return SensorsWindowsHardware(
+        id=hardware["id"],
+        name=hardware["name"],
+        type=hardware["type"],
+        subhardware=[
+            _get_hardware(subhardware)
+            for subhardware in hardware.get("subhardware") or []
+        ],
+        sensors=[
+            SensorsWindowsSensor(
+                id=sensor["id"],
+                name=sensor["name"],
+                type=sensor["type"],
+                value=sensor["value"],
+            )
+            for sensor in hardware["sensors"]
+        ],
+    )
+
+
+def _get_nvidia(nvidia: dict) -> SensorsNVIDIA:
+    """Get NVIDIA sensors."""
+    chipset = nvidia["chipset"]
+    driver = nvidia["driver"]
+    return SensorsNVIDIA(
+        chipset=SensorsNVIDIAChipset(
+            id=chipset["id"],
+            name=chipset["name"],
+            flags=chipset["flags"],
+            vendor_id=chipset["vendor_id"],
+            vendor_name=chipset["vendor_name"],
+        ),
+        displays=[
+            SensorsNVIDIADisplay(
+                id=display["id"],
+                name=display["name"],
+                active=display["active"],
+                available=display["available"],
+                connected=display["connected"],
+                dynamic=display["dynamic"],
+                aspect_horizontal=display["aspect_horizontal"],
+                aspect_vertical=display["aspect_vertical"],
+                brightness_current=display["brightness_current"],
+                brightness_default=display["brightness_default"],
+                brightness_max=display["brightness_max"],
+                brightness_min=display["brightness_min"],
+                color_depth=display["color_depth"],
+                connection_type=display["connection_type"],
+                pixel_clock=display["pixel_clock"],
+                refresh_rate=display["refresh_rate"],
+                resolution_horizontal=display["resolution_horizontal"],
+                resolution_vertical=display["resolution_vertical"],
+            )
+            for display in nvidia.get("displays") or []
+        ],
+        driver=SensorsNVIDIADriver(
+            branch_version=driver["branch_version"],
+            interface_version=driver["interface_version"],
+            version=driver["version"],
+        ),
+        gpus=[
+            SensorsNVIDIAGPU(
+                id=gpu["id"],
+                name=gpu["name"],
+                bios_oem_revision=gpu["bios_oem_revision"],
+                bios_revision=gpu["bios_revision"],
+                bios_version=gpu["bios_version"],
+                current_fan_speed_level=gpu["current_fan_speed_level"],
+                current_fan_speed_rpm=gpu["current_fan_speed_rpm"],
+                driver_model=gpu["driver_model"],
+                memory_available=gpu["memory_available"],
+                memory_capacity=gpu["memory_capacity"],
+                memory_maker=gpu["memory_maker"],
+                serial=gpu["serial"],
+                system_type=gpu["system_type"],
+                type=gpu["type"],
+            )
+            for gpu in nvidia.get("gpus") or []
+            if gpu is not None
+        ],
+    )
+
+
+def _get_windows_sensors(windows_sensors: dict) -> SensorsWindows:
+    """Get Windows sensors from the parsed helper output."""
+    hardware = windows_sensors.get("hardware")
+    nvidia = windows_sensors.get("nvidia")
+    return SensorsWindows(
+        hardware=(
+            [_get_hardware(item) for item in hardware] if hardware is not None else None
+        ),
+        nvidia=_get_nvidia(nvidia) if nvidia is not None else None,
+    )
+
 
 class SensorsUpdate(ModuleUpdateBase):
     """Sensors Update."""
 
     async def _get_fans(self) -> dict[str, list[sfan]] | None:
         """Get fans."""
-        if not hasattr(psutil, "sensors_fans"):
+        if _sensors_fans is None:
             return None
-        return psutil.sensors_fans()  # type: ignore
+        # psutil reads hwmon synchronously, keep it off the event loop
+        return await asyncio.to_thread(_sensors_fans)
 
     async def _get_temperatures(self) -> dict[str, list[shwtemp]] | None:
         """Get temperatures."""
-        if not hasattr(psutil, "sensors_temperatures"):
+        if _sensors_temperatures is None:
             return None
-        return psutil.sensors_temperatures(fahrenheit=False)  # type: ignore
+        return await asyncio.to_thread(_sensors_temperatures, fahrenheit=False)
 
     async def _get_windows_sensors(self) -> dict | None:
         """Get windows sensors."""
@@ -55,11 +156,12 @@ class SensorsUpdate(ModuleUpdateBase):
 
         self._logger.debug("Windows sensors path: %s", path)
         try:
-            with subprocess.Popen(
-                [path],
-                stdout=subprocess.PIPE,
-            ) as pipe:
-                result = pipe.communicate()[0].decode()
+            # Run without blocking the event loop while the sensors are read
+            process = await asyncio.create_subprocess_exec(
+                path,
+                stdout=asyncio.subprocess.PIPE,
+            )
+            result, _ = await process.communicate()
             self._logger.debug("Windows sensors result: %s", result)
         except Exception as exception:  # pylint: disable=broad-except
             self._logger.error(
@@ -68,6 +170,7 @@ class SensorsUpdate(ModuleUpdateBase):
             return None
 
         try:
+            # json.loads reads bytes directly, no need to decode to a str first
             return json.loads(result)
         except json.decoder.JSONDecodeError as exception:
             self._logger.error("JSONDecodeError", exc_info=exception)
@@ -76,125 +179,17 @@ class SensorsUpdate(ModuleUpdateBase):
     async def update_all_data(self) -> Sensors:
         """Update data."""
         fans, temperatures, windows_sensors = await asyncio.gather(
-            *[
-                self._get_fans(),
-                self._get_temperatures(),
-                self._get_windows_sensors(),
-            ]
+            self._get_fans(),
+            self._get_temperatures(),
+            self._get_windows_sensors(),
         )
 
         return Sensors(
             fans=fans,
             temperatures=temperatures,
-            windows_sensors=SensorsWindows(
-                hardware=[
-                    SensorsWindowsHardware(
-                        id=hardware["id"],
-                        name=hardware["name"],
-                        type=hardware["type"],
-                        subhardware=[
-                            SensorsWindowsHardware(
-                                id=subhardware["id"],
-                                name=subhardware["name"],
-                                type=subhardware["type"],
-                                subhardware=[],
-                                sensors=[
-                                    SensorsWindowsSensor(
-                                        id=sensor["id"],
-                                        name=sensor["name"],
-                                        type=sensor["type"],
-                                        value=sensor["value"],
-                                    )
-                                    for sensor in subhardware["sensors"]
-                                ],
-                            )
-                            for subhardware in hardware["subhardware"]
-                        ],
-                        sensors=[
-                            SensorsWindowsSensor(
-                                id=sensor["id"],
-                                name=sensor["name"],
-                                type=sensor["type"],
-                                value=sensor["value"],
-                            )
-                            for sensor in hardware["sensors"]
-                        ],
-                    )
-                    for hardware in windows_sensors["hardware"]
-                ]
-                if "hardware" in windows_sensors
-                and windows_sensors["hardware"] is not None
-                else None,
-                nvidia=SensorsNVIDIA(
-                    chipset=SensorsNVIDIAChipset(
-                        id=windows_sensors["nvidia"]["chipset"]["id"],
-                        name=windows_sensors["nvidia"]["chipset"]["name"],
-                        flags=windows_sensors["nvidia"]["chipset"]["flags"],
-                        vendor_id=windows_sensors["nvidia"]["chipset"]["vendor_id"],
-                        vendor_name=windows_sensors["nvidia"]["chipset"]["vendor_name"],
-                    ),
-                    displays=[
-                        SensorsNVIDIADisplay(
-                            id=display["id"],
-                            name=display["name"],
-                            active=display["active"],
-                            available=display["available"],
-                            connected=display["connected"],
-                            dynamic=display["dynamic"],
-                            aspect_horizontal=display["aspect_horizontal"],
-                            aspect_vertical=display["aspect_vertical"],
-                            brightness_current=display["brightness_current"],
-                            brightness_default=display["brightness_default"],
-                            brightness_max=display["brightness_max"],
-                            brightness_min=display["brightness_min"],
-                            color_depth=display["color_depth"],
-                            connection_type=display["connection_type"],
-                            pixel_clock=display["pixel_clock"],
-                            refresh_rate=display["refresh_rate"],
-                            resolution_horizontal=display["resolution_horizontal"],
-                            resolution_vertical=display["resolution_vertical"],
-                        )
-                        for display in windows_sensors["nvidia"]["displays"]
-                    ]
-                    if "displays" in windows_sensors["nvidia"]
-                    and windows_sensors["nvidia"]["displays"] is not None
-                    else [],
-                    driver=SensorsNVIDIADriver(
-                        branch_version=windows_sensors["nvidia"]["driver"][
-                            "branch_version"
-                        ],
-                        interface_version=windows_sensors["nvidia"]["driver"][
-                            "interface_version"
-                        ],
-                        version=windows_sensors["nvidia"]["driver"]["version"],
-                    ),
-                    gpus=[
-                        SensorsNVIDIAGPU(
-                            id=gpu["id"],
-                            name=gpu["name"],
-                            bios_oem_revision=gpu["bios_oem_revision"],
-                            bios_revision=gpu["bios_revision"],
-                            bios_version=gpu["bios_version"],
-                            current_fan_speed_level=gpu["current_fan_speed_level"],
-                            current_fan_speed_rpm=gpu["current_fan_speed_rpm"],
-                            driver_model=gpu["driver_model"],
-                            memory_available=gpu["memory_available"],
-                            memory_capacity=gpu["memory_capacity"],
-                            memory_maker=gpu["memory_maker"],
-                            serial=gpu["serial"],
-                            system_type=gpu["system_type"],
-                            type=gpu["type"],
-                        )
-                        for gpu in windows_sensors["nvidia"]["gpus"]
-                        if gpu is not None
-                    ]
-                    if "gpus" in windows_sensors["nvidia"]
-                    and windows_sensors["nvidia"]["gpus"] is not None
-                    else [],
-                )
-                if "nvidia" in windows_sensors and windows_sensors["nvidia"] is not None
-                else None,
-            )
-            if windows_sensors is not None
-            else None,
+            windows_sensors=(
+                _get_windows_sensors(windows_sensors)
+                if windows_sensors is not None
+                else None
+            ),
         )
@@ -1,14 +1,16 @@
 """System."""
 
 import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
 from enum import StrEnum
 import getpass
 import os
 import platform
-import re
 import socket
 import sys
-from typing import Any, override
+from time import monotonic
+from typing import Any, Final, override
 import uuid
 
 import aiohttp
@@ -23,6 +25,31 @@ from systembridgeshared.common import get_user_data_directory
 from .._version import __version__
 from .base import ModuleUpdateBase
 
+VERSION_LATEST_CACHE_TIME: Final[int] = 3600
+
+# HKLM keys that only exist while a reboot is pending
+PENDING_REBOOT_KEYS: Final[tuple[str, ...]] = (
+    # Reboot required by Windows Update or component servicing
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\WindowsUpdate\Auto Update\RebootRequired",
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Component Based Servicing\RebootPending",
+    # Recent installation requiring reboot
+    r"SOFTWARE\Microsoft\Updates\UpdateExeVolatile",
+    # System Center Configuration Manager
+    r"SOFTWARE\Microsoft\SMS\Mobile Client\Reboot Management\RebootData",
+)
+
+
+@dataclass
+class _StaticValues:
+    """System values that do not change while we are running."""
+
+    boot_time: float
+    fqdn: str
+    hostname: str
+    platform: str
+    platform_version: str
+    uuid: str
+
 
 # Replace this with systembridgebackend.modules.system.RunMode when possible
 class RunMode(StrEnum):
@@ -40,6 +67,9 @@ class SystemUpdate(ModuleUpdateBase):
         super().__init__()
         self._mac_address: str = self._get_mac_address()
 
+        # Read on the first update, getfqdn can block on a reverse DNS lookup
+        self._static_values: _StaticValues | None = None
+
         # Determine the run mode based on the running executable
         self._run_mode: RunMode = (
             RunMode.PYTHON if "python" in sys.executable.lower() else RunMode.STANDALONE
@@ -68,20 +98,17 @@ class SystemUpdate(ModuleUpdateBase):
         )}/releases/latest"
 
         self._version_latest: str | None = None
+        self._version_latest_time: float | None = None
 
-    async def _get_active_user_id(self) -> int:
+    def _get_active_user_id(self) -> int:
         """Get active user ID."""
         return os.getpid()
 
-    async def _get_active_user_name(self) -> str | None:
+    def _get_active_user_name(self) -> str | None:
         """Get active user."""
         return getpass.getuser()
 
-    async def _get_boot_time(self) -> float:
-        """Get boot time."""
-        return boot_time()
-
-    async def _get_camera_usage(self) -> list[str]:
+    def _get_camera_usage(self) -> list[str]:
         """Return a list of apps that are currently using the webcam."""
         active_apps: list[str] = []
         if sys.platform == "win32":
@@ -90,42 +117,28 @@ class SystemUpdate(ModuleUpdateBase):
 
             subkey_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\CapabilityAccessManager\ConsentStore\webcam"
 
-            def get_subkey_timestamp(subkey) -> int | None:
-                """Return the timestamp of the subkey."""
-                try:
-                    value, _ = winreg.QueryValueEx(subkey, "LastUsedTimeStop")
-                    return value
-                except OSError:
-                    pass
-                return None
-
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey_path)
-                # Enumerate over the subkeys of the webcam key
+            def walk(key) -> Iterator[tuple[str, int | None]]:
+                """Yield the name and last used stop time of each app subkey."""
                 subkey_count, _, _ = winreg.QueryInfoKey(key)
-                # Recursively open each subkey and check the "LastUsedTimeStop" value.
-                # A value of 0 means the camera is currently in use.
                 for idx in range(subkey_count):
                     subkey_name = winreg.EnumKey(key, idx)
-                    subkey_name_full = f"{subkey_path}\\{subkey_name}"
-                    subkey = winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey_name_full)
-                    if subkey_name == "NonPackaged":
-                        # Enumerate over the subkeys of the "NonPackaged" key
-                        subkey_count, _, _ = winreg.QueryInfoKey(subkey)
-                        for np_idx in range(subkey_count):
-                            subkey_name_np = winreg.EnumKey(subkey, np_idx)
-                            subkey_name_full_np = (
-                                f"{subkey_path}\\NonPackaged\\{subkey_name_np}"
-                            )
-                            subkey_np = winreg.OpenKey(
-                                winreg.HKEY_CURRENT_USER, subkey_name_full_np
-                            )
-                            if get_subkey_timestamp(subkey_np) == 0:
-                                active_apps.append(subkey_name_np)
-                    elif get_subkey_timestamp(subkey) == 0:
-                        active_apps.append(subkey_name)
-                    winreg.CloseKey(subkey)
-                winreg.CloseKey(key)
+                    # Open relative to the parent handle, not from the root
+                    with winreg.OpenKey(key, subkey_name) as subkey:
+                        if subkey_name == "NonPackaged":
+                            yield from walk(subkey)
+                            continue
+                        try:
+                            value, _ = winreg.QueryValueEx(subkey, "LastUsedTimeStop")
+                        except OSError:
+                            value = None
+                        yield subkey_name, value
+
+            try:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey_path) as key:
+                    # A value of 0 means the camera is currently in use.
+                    for name, timestamp in walk(key):
+                        if timestamp == 0:
+                            active_apps.append(name)
             except OSError:
                 pass
         elif sys.platform in ["darwin", "linux"]:
@@ -133,94 +146,54 @@ class SystemUpdate(ModuleUpdateBase):
             pass
         return active_apps
 
-    async def _get_fqdn(self) -> str:
-        """Get FQDN."""
-        return socket.getfqdn()
-
-    async def _get_hostname(self) -> str:
-        """Get hostname."""
-        return socket.gethostname()
-
-    async def _get_ip_address_4(self) -> str:
-        """Get IPv4 address."""
+    def _get_ip_address(self, family: int, host: str) -> str:
+        """Get the local address used to route to a host."""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.connect(("8.8.8.8", 80))
-            return sock.getsockname()[0]
+            # Connecting a UDP socket only picks a route, no packets are sent
+            with socket.socket(family, socket.SOCK_DGRAM) as sock:
+                sock.connect((host, 80))
+                return sock.getsockname()[0]
         except OSError:
             return ""
 
-    async def _get_ip_address_6(self) -> str:
+    def _get_ip_address_4(self) -> str:
+        """Get IPv4 address."""
+        return self._get_ip_address(socket.AF_INET, "8.8.8.8")
+
+    def _get_ip_address_6(self) -> str:
         """Get IPv6 address."""
-        try:
-            sock = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
-            sock.connect(("2001:4860:4860::8888", 80))
-            return sock.getsockname()[0]
-        except OSError:
-            return ""
+        return self._get_ip_address(socket.AF_INET6, "2001:4860:4860::8888")
 
     def _get_mac_address(self) -> str:
         """Get MAC address."""
-        return ":".join(re.findall("..", f"{uuid.getnode():012x}"))
+        return uuid.getnode().to_bytes(6).hex(":")
 
-    async def _get_pending_reboot(self) -> bool:
+    def _get_pending_reboot(self) -> bool:
         """Check if there is a pending reboot."""
         if sys.platform == "win32":
             # Read from registry for pending reboot
             import winreg  # pylint: disable=import-error,import-outside-toplevel
 
-            reg = winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE)
-            # Check for "Reboot Required" keys
-            try:
-                key = winreg.OpenKey(
-                    reg,
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion\WindowsUpdate\Auto Update\RebootRequired",
-                )
-                winreg.CloseKey(key)
-                return True
-            except OSError:
-                pass
-            try:
-                key = winreg.OpenKey(
-                    reg,
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Component Based Servicing\RebootPending",
-                )
-                winreg.CloseKey(key)
-                return True
-            except OSError:
-                pass
-            # Check for recent installation requiring reboot
-            try:
-                key = winreg.OpenKey(
-                    reg,
-                    r"SOFTWARE\Microsoft\Updates\UpdateExeVolatile",
-                )
-                winreg.CloseKey(key)
-                return True
-            except OSError:
-                pass
-            # Check for System Center Configuration Manager
-            try:
-                key = winreg.OpenKey(
-                    reg,
-                    r"SOFTWARE\Microsoft\SMS\Mobile Client\Reboot Management\RebootData",
-                )
-                winreg.CloseKey(key)
-                return True
-            except OSError:
-                pass
-            # Check for pending file rename operations
-            try:
-                key = winreg.OpenKey(
-                    reg,
-                    r"SYSTEM\CurrentControlSet\Control\Session Manager",
-                )
-                value, _ = winreg.QueryValueEx(key, "PendingFileRenameOperations")
-                winreg.CloseKey(key)
-                if value:
-                    return True
-            except OSError:
-                pass
+            with winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE) as reg:
+                for subkey_path in PENDING_REBOOT_KEYS:
+                    try:
+                        winreg.OpenKey(reg, subkey_path).Close()
+                        return True
+                    except OSError:
+                        pass
+                # Check for pending file rename operations
+                try:
+                    with winreg.OpenKey(
+                        reg,
+                        r"SYSTEM\CurrentControlSet\Control\Session Manager",
+                    ) as key:
+                        value, _ = winreg.QueryValueEx(
+                            key, "PendingFileRenameOperations"
+                        )
+                    if value:
+                        return True
+                except OSError:
+                    pass
         elif sys.platform in ["darwin", "linux"]:
             if os.path.exists("/var/run/reboot-required"):
                 return True
@@ -228,24 +201,26 @@ class SystemUpdate(ModuleUpdateBase):
                 return True
         return False
 
-    async def _get_platform(self) -> str:
-        """Get platform."""
-        return platform.system()
-
-    async def _get_platform_version(self) -> str:
-        """Get platform version."""
-        return platform.version()
-
-    async def _get_uptime(self) -> float:
+    def _get_uptime(self) -> float:
         """Get uptime."""
         return os.times().system
 
     async def _get_users(self) -> list[suser]:  # pylint: disable=unsubscriptable-object
         """Get users."""
-        return users()
+        return await asyncio.to_thread(users)
+
+    def _get_static_values(self) -> _StaticValues:
+        """Get static values."""
+        return _StaticValues(
+            boot_time=boot_time(),
+            fqdn=socket.getfqdn(),
+            hostname=socket.gethostname(),
+            platform=platform.system(),
+            platform_version=platform.version(),
+            uuid=self._get_uuid(),
+        )
 
-    @property
-    def _uuid(self) -> str:
+    def _get_uuid(self) -> str:
         """Get UUID."""
         # cat /var/lib/dbus/machine-id
         if sys.platform == "linux":
@@ -263,11 +238,9 @@ class SystemUpdate(ModuleUpdateBase):
         except Exception:  # pylint: disable=broad-except
             return self._mac_address
 
-    async def _check_rate_limit(self) -> int:
+    async def _check_rate_limit(self, session: aiohttp.ClientSession) -> int:
         """Check the GitHub API rate limit."""
-        async with aiohttp.ClientSession() as session, session.get(
-            "https://api.github.com/rate_limit"
-        ) as response:
+        async with session.get("https://api.github.com/rate_limit") as response:
             if response.status == 200:
                 data = await response.json()
                 rate_limit = data.get("rate", {})
@@ -275,32 +248,45 @@ class SystemUpdate(ModuleUpdateBase):
         return 0
 
     async def _get_version_latest(self) -> Any | None:
-        """Get latest version from GitHub."""
-        self._logger.info("Get latest version from GitHub")
-
-        # Check if the rate limit allows the request
-        rate_limit_remaining = await self._check_rate_limit()
-        self._logger.debug("Rate limit: %s", rate_limit_remaining)
-        if rate_limit_remaining < 1:
-            self._logger.warning("Rate limit exceeded. Skipping request.")
+        """Get latest version from GitHub, checked every VERSION_LATEST_CACHE_TIME."""
+        if (
+            self._version_latest_time is not None
+            and monotonic() - self._version_latest_time < VERSION_LATEST_CACHE_TIME
+        ):
             return self._version_latest
 
-        url = f"https://api.github.com/repos/timmo001/{(
-            'system-bridge' if self._run_mode == RunMode.STANDALONE else 'system-bridge-backend'
-        )}/releases/latest"
-        self._logger.debug("GitHub API URL: %s", url)
-
-        # Use the GitHub API to get the latest release
-        async with aiohttp.ClientSession() as session, session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data is not None and (tag_name := data.get("tag_name")) is not None:
-                    self._version_latest = tag_name.replace("v", "")
-                    self._logger.info("Latest version: %s", self._version_latest)
+        self._logger.info("Get latest version from GitHub")
 
+        # Share one session between the rate limit and release requests
+        async with aiohttp.ClientSession() as session:
+            # Check if the rate limit allows the request
+            rate_limit_remaining = await self._check_rate_limit(session)
+            self._logger.debug("Rate limit: %s", rate_limit_remaining)
+            if rate_limit_remaining < 1:
+                self._logger.warning("Rate limit exceeded. Skipping request.")
+                self._version_latest_time = monotonic()
+                return self._version_latest
+
+            url = f"https://api.github.com/repos/timmo001/{(
+                'system-bridge' if self._run_mode == RunMode.STANDALONE else 'system-bridge-backend'
+            )}/releases/latest"
+            self._logger.debug("GitHub API URL: %s", url)
+
+            # Use the GitHub API to get the latest release
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if (
+                        data is not None
+                        and (tag_name := data.get("tag_name")) is not None
+                    ):
+                        self._version_latest = tag_name.replace("v", "")
+                        self._logger.info("Latest version: %s", self._version_latest)
+
+        self._version_latest_time = monotonic()
         return self._version_latest
 
-    async def _get_version_newer_available(self) -> bool | None:
+    def _get_version_newer_available(self) -> bool | None:
         """Check if newer version is available."""
         if self._version_latest is not None and self._version is not None:
             return parse(self._version_latest) > parse(self._version)
@@ -311,47 +297,26 @@ class SystemUpdate(ModuleUpdateBase):
         """Update all data."""
         self._logger.debug("Update all data")
 
-        (
-            active_user_name,
-            boot_time_result,
-            camera_usage,
-            fqdn,
-            hostname,
-            ip_address_4,
-            ip_address_6,
-            pending_reboot,
-            platform_result,
-            platform_version,
-            uptime,
-            users_result,
-            version_latest,
-        ) = await asyncio.gather(
-            *[
-                self._get_active_user_name(),
-                self._get_boot_time(),
-                self._get_camera_usage(),
-                self._get_fqdn(),
-                self._get_hostname(),
-                self._get_ip_address_4(),
-                self._get_ip_address_6(),
-                self._get_pending_reboot(),
-                self._get_platform(),
-                self._get_platform_version(),
-                self._get_uptime(),
-                self._get_users(),
-                self._get_version_latest(),
-            ]
+        if (static_values := self._static_values) is None:
+            static_values = self._static_values = await asyncio.to_thread(
+                self._get_static_values
+            )
+
+        users_result, version_latest = await asyncio.gather(
+            self._get_users(),
+            self._get_version_latest(),
         )
+        active_user_name = self._get_active_user_name()
 
         return System(
-            boot_time=boot_time_result,
-            fqdn=fqdn,
-            hostname=hostname,
-            ip_address_4=ip_address_4,
+            boot_time=static_values.boot_time,
+            fqdn=static_values.fqdn,
+            hostname=static_values.hostname,
+            ip_address_4=self._get_ip_address_4(),
             mac_address=self._mac_address,
-            platform_version=platform_version,
-            platform=platform_result,
-            uptime=uptime,
+            platform_version=static_values.platform_version,
+            platform=static_values.platform,
+            uptime=self._get_uptime(),
             # run_mode=self._run_mode,
             users=[
                 SystemUser(
@@ -364,12 +329,12 @@ class SystemUpdate(ModuleUpdateBase):
                 )
                 for user in users_result
             ],
-            uuid=self._uuid,
+            uuid=static_values.uuid,
             version=self._version or "",
-            camera_usage=camera_usage,
-            ip_address_6=ip_address_6,
-            pending_reboot=pending_reboot,
+            camera_usage=self._get_camera_usage(),
+            ip_address_6=self._get_ip_address_6(),
+            pending_reboot=self._get_pending_reboot(),
             # version_latest_url=self._version_latest_url,
             version_latest=version_latest,
-            version_newer_available=await self._get_version_newer_available(),
+            version_newer_available=self._get_version_newer_available(),
         )
@@ -1,7 +1,7 @@
 """WebSocket Handler."""
 
 from collections.abc import Callable
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict
 from json import JSONDecodeError
 import os
 from uuid import uuid4
@@ -161,15 +161,15 @@ class WebSocketHandler(Base):
         if module not in MODULES:
             self._logger.info("Data module %s not in registered modules", module)
             return
-        data_module = getattr(data, module)
-
+        # _send_response converts the whole response, nested dataclasses
+        # included, so pass the module data as is rather than copy it twice
         await self._send_response(
             Response(
                 id=str(uuid4()),
                 type=TYPE_DATA_UPDATE,
                 message="Data changed",
                 module=module,
-                data=asdict(data_module) if is_dataclass(data_module) else data_module,
+                data=getattr(data, module),
             )
         )
 
@@ -432,7 +432,7 @@ class WebSocketHandler(Base):
                 return
 
             self._logger.warning("Sending notification: %s", model.title)
-            for listener in self._listeners.registered_listeners:
+            for listener in self._listeners.registered_listeners.values():
                 self._logger.warning(
                     "Sending notification to listener: %s", listener.id
                 )